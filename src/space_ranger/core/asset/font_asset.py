@@ -10,6 +10,7 @@ class FontFactory:
     """A font factory.
 
     Can load fonts and create new pygame.font.Font instances.
+    Fonts are loaded once per size and reused afterwards.
 
     :param str | Path | None path: A path to the font file.
     """
@@ -17,10 +18,14 @@ class FontFactory:
     def __init__(self, path: str | Path | None, **kwargs: Any) -> None:
         self.path = path
         self.kwargs = kwargs
+        self._fonts: dict[int, pg.font.Font] = {}
 
     def __call__(self, size: int = 16) -> pg.font.Font:
         """Load font using given size."""
-        return pg.font.Font(self.path, size=size, **self.kwargs)
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pg.font.Font(self.path, size=size, **self.kwargs)
+        return font
 
 
 class FontAsset(Asset[FontFactory]):
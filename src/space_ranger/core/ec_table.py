@@ -8,6 +8,9 @@ from .errors import ComponentsCollisionError, EntityDataRemovalAttemptError, Unk
 from .utils import MISSING
 
 
+type Archetype = frozenset[ComponentKey]
+
+
 class EcTable:
     """Entity-component table.
 
@@ -29,10 +32,16 @@ class EcTable:
     EntityUid2 | ComponentA() | None         | ... | ComponentX() |
     ...        | ...          | ...          | ... | ...          |
     EntityUidN | None         | None         | ... | ComponentX() |
+
+    Entities are also grouped by their archetype (a set of keys
+    of the components they have), so entities with some set of
+    components can be queried without checking every entity.
     """
 
     def __init__(self) -> None:
         self._table: dict[EntityUid, dict[ComponentKey, Component]] = {}
+        self._archetypes: dict[Archetype, set[EntityUid]] = {}
+        self._entities_archetypes: dict[EntityUid, Archetype] = {}
 
     # Entity
 
@@ -53,6 +62,7 @@ class EcTable:
             uid = generate_entity_uid()
 
         self._table[uid] = {EntityData: EntityData(name, uid)}  # type: ignore
+        self._update_archetype(uid)
 
         for component in components:
             self.add_component(uid, component)
@@ -93,6 +103,7 @@ class EcTable:
         if uid not in self._table:
             raise UnknownEntityUidError(uid)
         del self._table[uid]
+        self._update_archetype(uid)
 
     # Component
 
@@ -113,6 +124,7 @@ class EcTable:
             raise ComponentsCollisionError(entity, component)
 
         self._table[entity_uid][key] = component
+        self._update_archetype(entity_uid)
 
     def get_component(self, entity_uid: EntityUid, component_key: ComponentKey) -> Component | None:
         """Get a component instance by the given `entity_uid` and `component_key`.
@@ -151,6 +163,49 @@ class EcTable:
             raise EntityDataRemovalAttemptError(entity)
 
         del self._table[entity_uid][component_key]
+        self._update_archetype(entity_uid)
+
+    # Archetypes
+
+    def get_archetype(self, uid: EntityUid) -> Archetype:
+        """Get an archetype of an entity.
+
+        An archetype is a set of keys of all the components
+        that an entity has (including :class:`EntityData`).
+
+        :param EntityUid uid: Entity UID.
+
+        :raises UnknownEntityUidError: Entity with the given UID does not exist.
+
+        :return Archetype: The entity archetype.
+        """
+        archetype = self._entities_archetypes.get(uid)
+        if archetype is None:
+            raise UnknownEntityUidError(uid)
+        return archetype
+
+    def _update_archetype(self, uid: EntityUid) -> None:
+        """Move an entity to the bucket of its current archetype.
+
+        Must be called each time the set of entity components changes.
+        If the entity was deleted it is just removed from its bucket.
+
+        :param EntityUid uid: UID of an entity which components were changed.
+        """
+        old_archetype = self._entities_archetypes.pop(uid, None)
+        if old_archetype is not None:
+            bucket = self._archetypes[old_archetype]
+            bucket.discard(uid)
+            if not bucket:
+                del self._archetypes[old_archetype]
+
+        components = self._table.get(uid)
+        if components is None:
+            return
+
+        new_archetype = frozenset(components)
+        self._entities_archetypes[uid] = new_archetype
+        self._archetypes.setdefault(new_archetype, set()).add(uid)
 
     # Iterators
 
@@ -159,7 +214,8 @@ class EcTable:
 
         :return Iterator[Entity]: Iterator over entities.
         """
-        return iter((self.get_entity_by_uid(uid) for uid in self._table))
+        # UIDs are taken from the table itself, so there is no need to check them
+        return iter((Entity(uid, self) for uid in self._table))
 
     def iter_components(self, uid: EntityUid) -> t.Iterator[Component]:
         """Iterate over entity components.
@@ -170,9 +226,25 @@ class EcTable:
 
         :return Iterator[Component]: Iterator over entity components.
         """
-        # below line invokes an UID check and might raise UnknownEntityUidError
-        self.get_entity_by_uid(uid)
-        return iter((self.get_component(uid, key) for key in self._table[uid]))  # type: ignore
+        components = self._table.get(uid)
+        if components is None:
+            raise UnknownEntityUidError(uid)
+        return iter(components.values())  # type: ignore
+
+    def iter_uids_by_components(self, *components_keys: ComponentKey) -> t.Iterator[EntityUid]:
+        """Iterate over UIDs of entities having all the given components.
+
+        Only archetypes are checked, so the cost depends on the number
+        of distinct archetypes rather than on the number of entities.
+
+        :param ComponentKey components_keys: Components keys that entity should have.
+
+        :return Iterator[EntityUid]: Iterator over matching entities UIDs.
+        """
+        required = frozenset(components_keys)
+        for archetype, uids in self._archetypes.items():
+            if required <= archetype:
+                yield from uids
 
     # Quering entities
 
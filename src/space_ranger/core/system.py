@@ -7,7 +7,7 @@ from enum import Enum
 
 from .component import ComponentKey
 from .entity import Entity, EntityUid
-from .errors import SystemExecutorIsNotCallableError
+from .errors import SystemExecutorIsNotCallableError, UnknownEntityUidError
 
 
 if t.TYPE_CHECKING:
@@ -38,6 +38,8 @@ class System:
         required by this system.
     """
 
+    __slots__ = ("_name", "_executor", "_ec_table", "_required_components", "_entities")
+
     def __init__(
         self,
         name: str,
@@ -48,7 +50,7 @@ class System:
         self._name = name
         self._executor = executor
         self._ec_table = ec_table
-        self._required_components = set(required_components)
+        self._required_components = frozenset(required_components)
         self._entities: set[EntityUid] = set()
 
     def match_entity(self, entity_uid: EntityUid) -> bool:
@@ -65,10 +67,12 @@ class System:
 
         :return bool: `True`, if the entity matches this system, `False` otherwise.
         """
-        return all(
-            self._ec_table.get_component(entity_uid, component_key) is not None
-            for component_key in self._required_components
-        )
+        try:
+            archetype = self._ec_table.get_archetype(entity_uid)
+        except UnknownEntityUidError:
+            # an unknown entity has no components at all
+            return not self._required_components
+        return self._required_components <= archetype
 
     def add_entity(self, entity_uid: EntityUid) -> None:
         """Add an entity to the system processing queue.
@@ -87,14 +91,16 @@ class System:
     def update_entities(self) -> None:
         """Update entities processing queue.
 
-        Queries :class:`EcTable` for compatible entities and
+        Queries :class:`EcTable` archetypes for compatible entities and
         updates processing queue.
         """
-        self._entities = {entity.uid for entity in self._ec_table.iter_entities() if self.match_entity(entity.uid)}
+        self._entities = set(self._ec_table.iter_uids_by_components(*self._required_components))
 
     def run(self, app: Application) -> None:
         """Run a system."""
-        self._executor(app, {self._ec_table.get_entity_by_uid(uid) for uid in self._entities})
+        # resolve the lookup once instead of once per queued entity
+        get_entity_by_uid = self._ec_table.get_entity_by_uid
+        self._executor(app, {get_entity_by_uid(uid) for uid in self._entities})
 
 
 def make_system(system_executor: SystemExecutor, ec_table: EcTable, *required_components: ComponentKey) -> System:
@@ -162,6 +168,8 @@ class SystemsPipeline:
     the order of systems execution.
     """
 
+    __slots__ = ("_systems",)
+
     def __init__(self) -> None:
         self._systems: set[System] = set()
 
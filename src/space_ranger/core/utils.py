@@ -34,6 +34,28 @@ class _Missing:
 MISSING = _Missing()
 
 
+class RebuildMixin:
+    """Rebuild mixin.
+
+    Lets an object skip rebuilding its image when nothing
+    the image depends on has changed since the last build.
+    """
+
+    _build_key: tuple | None = None
+
+    def _needs_rebuild(self, build_key: tuple) -> bool:
+        """Check if an object has to be rebuilt.
+
+        :param tuple build_key: All values the built image depends on.
+
+        :return bool: `True`, if the key differs from the one of the last build, `False` otherwise.
+        """
+        if build_key == self._build_key:
+            return False
+        self._build_key = build_key
+        return True
+
+
 type ColorType = pg.color.Color | tuple[int, int, int] | tuple[int, int, int, int] | str
 type Bool = bool | t.Literal[0, 1]
 type Alignment = t.Literal["left", "center", "right"]
@@ -111,19 +133,50 @@ def draw_arrow(
 
     arrow_tip = pos + vec
 
-    arrow_line_1 = -vec
-    arrow_line_1.normalize_ip()
-    arrow_line_1.rotate_ip(-arrow_line_angle)
-    arrow_line_1 *= arrow_line_length
+    # both tip lines share the same direction, just rotated in opposite ways
+    arrow_line = vec.normalize() * -arrow_line_length
+    arrow_line_1 = arrow_line.rotate(-arrow_line_angle)
+    arrow_line_2 = arrow_line.rotate(arrow_line_angle)
+
+    # draw the whole arrow as a single polyline: body, first tip line, back to tip, second tip line
+    points = (pos, arrow_tip, arrow_tip + arrow_line_1, arrow_tip, arrow_tip + arrow_line_2)
+    pg.draw.lines(surface, color, False, points, width=width)
 
-    arrow_line_2 = -vec
-    arrow_line_2.normalize_ip()
-    arrow_line_2.rotate_ip(arrow_line_angle)
-    arrow_line_2 *= arrow_line_length
 
-    pg.draw.line(surface, color, pos, arrow_tip, width=width)
-    pg.draw.line(surface, color, arrow_tip, arrow_tip + arrow_line_1, width=width)
-    pg.draw.line(surface, color, arrow_tip, arrow_tip + arrow_line_2, width=width)
+def convert_alpha(surface: pg.Surface) -> pg.Surface:
+    """Convert a surface to the display pixel format.
+
+    Converted surfaces are blitted much faster, as no per-blit
+    format conversion is needed. If there is no display yet
+    (e.g. in tests) the surface is returned as is.
+
+    :param surface: A surface to convert.
+    :type surface: pg.Surface
+
+    :return: A converted surface with per-pixel alpha.
+    :rtype: pg.Surface
+    """
+    if pg.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+def convert(surface: pg.Surface) -> pg.Surface:
+    """Convert an opaque surface to the display pixel format.
+
+    Unlike :func:`convert_alpha` the result has no per-pixel alpha,
+    so SDL can blit it with a plain copy. If there is no display yet
+    (e.g. in tests) the surface is returned as is.
+
+    :param surface: A surface to convert.
+    :type surface: pg.Surface
+
+    :return: A converted opaque surface.
+    :rtype: pg.Surface
+    """
+    if pg.display.get_surface() is None:
+        return surface
+    return surface.convert()
 
 
 _DEFAULT_COLOR = pg.color.Color(0, 0, 0)
@@ -144,7 +197,7 @@ def rect(width: int, height: int, color: pg.color.Color = _DEFAULT_COLOR) -> pg.
     """
     surf = pg.Surface((width, height), pg.SRCALPHA)
     surf.fill(color)
-    return surf
+    return convert_alpha(surf)
 
 
 def circle(radius: int, color: pg.color.Color = _DEFAULT_COLOR) -> pg.Surface:
@@ -159,10 +212,10 @@ def circle(radius: int, color: pg.color.Color = _DEFAULT_COLOR) -> pg.Surface:
     :rtype: pg.Surface
     """
     diameter = radius * 2
+    # SRCALPHA surfaces are created fully transparent, no need to clear it
     surf = pg.Surface((diameter, diameter), pg.SRCALPHA)
-    surf.fill((0, 0, 0, 0))
     pg.draw.circle(surf, color, (radius, radius), radius)
-    return surf
+    return convert_alpha(surf)
 
 
 def square(size: int, color: pg.color.Color = _DEFAULT_COLOR) -> pg.Surface:
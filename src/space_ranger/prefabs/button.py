@@ -1,11 +1,14 @@
 import pygame as pg
 
-from space_ranger.core import GameObject
 from space_ranger.core.animation import HoverAnimation
 from space_ranger.core.property import Color, Font, Int, String
+from space_ranger.core.utils import convert, convert_alpha
 
+from .text import render_text
+from .ui_elem import CLICK_COLOR, HOVER_COLOR, UIElem
 
-class Button(GameObject):
+
+class Button(UIElem):
     """A button."""
 
     color = Color(100)
@@ -16,6 +19,9 @@ class Button(GameObject):
     text_size = Int(100)
     text_font = Font()
 
+    _back: pg.Surface | None = None
+    _back_opaque: bool = False
+
     def __init__(
         self,
         color: Color.InputType = 100,
@@ -36,21 +42,22 @@ class Button(GameObject):
         pg.draw.rect()
 
     def _start(self) -> None:
-        tmp = self.text_font(self.text_size).render(self.text, 0, self.color)
-        self.width = tmp.get_width() * 1.3
-        self.height = tmp.get_height() * 1.3
+        # measure the text without rasterizing it
+        text_width, text_height = self.text_font(self.text_size).size(self.text)
+        self.width = text_width * 1.3
+        self.height = text_height * 1.3
 
         hover_color = Color.adapt(self.hover_color)
 
         self.hover_animation = HoverAnimation(
-            (self, "color", Color, self.color, Color.adapt(70)),
+            (self, "color", Color, self.color, HOVER_COLOR),
             (self, "width", Int, self.width, self.width + 3),
             (self, "height", Int, self.height, self.height + 3),
             (self, "text_color", Color, self.text_color, hover_color),
             duration=5000,
         )
         self.click_animation = HoverAnimation(
-            (self, "color", Color, self.color, Color.adapt(50)),
+            (self, "color", Color, self.color, CLICK_COLOR),
             (self, "width", Int, self.width, self.width - 3),
             (self, "height", Int, self.height, self.height - 3),
             (self, "text_color", Color, self.text_color, hover_color),
@@ -58,19 +65,37 @@ class Button(GameObject):
         )
 
     def _build(self) -> None:
-        text_surface = self.text_font(self.text_size).render(self.text, True, self.text_color)
-        back = pg.Surface((self.width, self.height), pg.SRCALPHA)
-        back.fill(self.color)
-        back.blit(
-            text_surface,
-            (
-                int((self.width - text_surface.get_width()) / 2),
-                int((self.height - text_surface.get_height()) / 2),
-            ),
+        build_key = (
+            self.width,
+            self.height,
+            tuple(self.color),
+            self.text,
+            tuple(self.text_color),
+            self.text_size,
+            self.text_font,
         )
+        if not self._needs_rebuild(build_key):
+            return
+
+        text_surface = render_text(self.text_font, self.text_size, self.text, self.text_color)
+        # reuse background surface while button size and opacity stay the same,
+        # opaque buttons get a surface without per-pixel alpha so SDL can use a plain copy blit
+        size = (self.width, self.height)
+        opaque = pg.Color(self.color).a == 255
+        if self._back is None or self._back.get_size() != size or self._back_opaque != opaque:
+            if opaque:
+                self._back = convert(pg.Surface(size))
+            else:
+                self._back = convert_alpha(pg.Surface(size, pg.SRCALPHA))
+            self._back_opaque = opaque
+        back = self._back
+        back.fill(self.color)
+        text_width, text_height = text_surface.get_size()
+        back.blit(text_surface, ((self.width - text_width) // 2, (self.height - text_height) // 2))
         self.image = back
 
     def _update(self, delta_time: int) -> None:
-        self.hover_animation.play(delta_time, self.rect.collidepoint(*pg.mouse.get_pos()))
+        self._update_hover()
+        self.hover_animation.play(delta_time, self.is_hovered)
         if self.is_clicked:
             self.click_animation.play(delta_time, self.is_clicked)
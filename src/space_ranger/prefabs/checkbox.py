@@ -1,17 +1,24 @@
 import pygame as pg
 
-from space_ranger.core import GameObject
 from space_ranger.core.animation import HoverAnimation
 from space_ranger.core.property import Bool, Color, Int
+from space_ranger.core.utils import convert_alpha
 
+from .ui_elem import CLICK_COLOR, HOVER_COLOR, UIElem
 
-class Checkbox(GameObject):
+
+_CHECK_MARK_COLOR = Color.adapt(255)
+
+
+class Checkbox(UIElem):
     """Checkbox."""
 
     is_checked = Bool(False)
     back_color = Color(170)
     size = Int(50)
 
+    _check_mark: pg.Surface | None = None
+
     def __init__(
         self,
         is_checked: Bool.InputType = False,
@@ -23,27 +30,40 @@ class Checkbox(GameObject):
         self.size = size
         super().__init__()
         self.hover_animation = HoverAnimation(
-            (self, "back_color", Color, self.back_color, Color.adapt(70)),
+            (self, "back_color", Color, self.back_color, HOVER_COLOR),
             (self, "size", Int, self.size, self.size + 1),
             duration=100,
         )
         self.click_animation = HoverAnimation(
-            (self, "back_color", Color, self.back_color, Color.adapt(50)),
+            (self, "back_color", Color, self.back_color, CLICK_COLOR),
             (self, "size", Int, self.size, self.size - 1),
             duration=10,
         )
         self._checked_on_previous_frame = False
 
     def _build(self) -> None:
-        root = pg.Surface((self.size, self.size), pg.SRCALPHA)
+        if not self._needs_rebuild((self.size, tuple(self.back_color), self.is_checked)):
+            return
+
+        root = convert_alpha(pg.Surface((self.size, self.size), pg.SRCALPHA))
         root.fill(self.back_color)
         if self.is_checked:
-            check_mark = pg.Surface((self.size * 0.7, self.size * 0.7), pg.SRCALPHA)
-            check_mark.fill(Color.adapt(255))
-            root.blit(check_mark, (self.size * 0.15, self.size * 0.15))
+            root.blit(self._get_check_mark(), (self.size * 0.15, self.size * 0.15))
         self.image = root
 
+    def _get_check_mark(self) -> pg.Surface:
+        """Get a check mark surface.
+
+        The surface is created again only when the checkbox size changes.
+        """
+        mark_size = int(self.size * 0.7)
+        if self._check_mark is None or self._check_mark.get_width() != mark_size:
+            self._check_mark = convert_alpha(pg.Surface((mark_size, mark_size), pg.SRCALPHA))
+            self._check_mark.fill(_CHECK_MARK_COLOR)
+        return self._check_mark
+
     def _update(self, delta_time: int) -> None:
+        self._update_hover()
         self.hover_animation.play(delta_time, self.is_hovered)
         if self.is_clicked:
             self.click_animation.play(delta_time, self.is_clicked)
@@ -2,9 +2,10 @@ import pygame as pg
 
 from space_ranger.core import GameObject
 from space_ranger.core.property import Color, Int
+from space_ranger.core.utils import RebuildMixin, convert_alpha
 
 
-class Rectangle(GameObject):
+class Rectangle(RebuildMixin, GameObject):
     """Rectangle."""
 
     color = Color(127)
@@ -12,5 +13,8 @@ class Rectangle(GameObject):
     height = Int(100)
 
     def _build(self) -> None:
-        self.image = pg.Surface((self.width, self.height), pg.SRCALPHA)
+        if not self._needs_rebuild((self.width, self.height, tuple(self.color))):
+            return
+
+        self.image = convert_alpha(pg.Surface((self.width, self.height), pg.SRCALPHA))
         self.image.fill(self.color)
@@ -1,11 +1,13 @@
 import pygame as pg
 
-from space_ranger.core import GameObject
 from space_ranger.core.animation import HoverAnimation
 from space_ranger.core.property import Color, Float, Int
+from space_ranger.core.utils import convert_alpha
 
+from .ui_elem import HOVER_COLOR, UIElem
 
-class Slider(GameObject):
+
+class Slider(UIElem):
     """Slider UI."""
 
     value = Float(0, 0, 1)
@@ -14,22 +16,26 @@ class Slider(GameObject):
     back_color = Color(170)
     slider_color = Color(255)
 
+    _knob: pg.Surface | None = None
+    _knob_key: tuple | None = None
+
     def __init__(self) -> None:
         super().__init__()
         self.hover_animation = HoverAnimation(
-            (self, "back_color", Color, self.back_color, Color.adapt(70)),
+            (self, "back_color", Color, self.back_color, HOVER_COLOR),
             duration=200,
         )
 
     def _build(self) -> None:
-        root = pg.Surface((self.width, self.height), pg.SRCALPHA)
-        root.fill(self.back_color)
+        build_key = (self.width, self.height, self.value, tuple(self.back_color), tuple(self.slider_color))
+        if not self._needs_rebuild(build_key):
+            return
 
-        slider = pg.Surface((self.height, self.height), pg.SRCALPHA)
-        slider.fill(self.slider_color)
+        root = convert_alpha(pg.Surface((self.width, self.height), pg.SRCALPHA))
+        root.fill(self.back_color)
 
         root.blit(
-            slider,
+            self._get_knob(),
             (
                 (self.width - self.height) * self.value,
                 0,
@@ -37,12 +43,22 @@ class Slider(GameObject):
         )
         self.image = root
 
+    def _get_knob(self) -> pg.Surface:
+        """Get a slider knob surface.
+
+        The surface is created again only when slider height or color changes.
+        """
+        knob_key = (self.height, tuple(self.slider_color))
+        if knob_key != self._knob_key:
+            self._knob = convert_alpha(pg.Surface((self.height, self.height), pg.SRCALPHA))
+            self._knob.fill(self.slider_color)
+            self._knob_key = knob_key
+        return self._knob
+
     def _update(self, delta_time: int) -> None:
+        self._update_hover()
         self.hover_animation.play(delta_time, self.is_hovered)
 
         if self.is_clicked:
-            self.value = pg.math.clamp(
-                (pg.mouse.get_pos()[0] - self.rect.x - self.height / 2) / (self.width - self.height),
-                0,
-                1,
-            )
+            value = (pg.mouse.get_pos()[0] - self.rect.x - self.height / 2) / (self.width - self.height)
+            self.value = 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
@@ -1,8 +1,46 @@
+from collections import OrderedDict
+
+import pygame as pg
+
 from space_ranger.core import GameObject
+from space_ranger.core.asset import FontFactory
 from space_ranger.core.property import Color, Font, Int, String
+from space_ranger.core.utils import RebuildMixin, convert_alpha
+
+
+_TEXT_CACHE_SIZE = 256
+_text_cache: OrderedDict[tuple, pg.Surface] = OrderedDict()
+
+
+def render_text(font: FontFactory, size: int, string: str, color: pg.Color) -> pg.Surface:
+    """Render a text surface.
 
+    Rendered surfaces are cached (least recently used ones are dropped),
+    so rendering the same text again does not rasterize it again.
+    Returned surfaces are shared and must not be modified.
 
-class Text(GameObject):
+    :param FontFactory font: A font factory to render text with.
+    :param int size: Font size.
+    :param str string: Text to render.
+    :param pg.Color color: Text color.
+
+    :return pg.Surface: A surface with rendered text.
+    """
+    # key on the factory itself, an id() could be reused by another factory once this one is collected
+    key = (font, size, string, tuple(color))
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+
+    surface = convert_alpha(font(size).render(string, True, color))
+    _text_cache[key] = surface
+    if len(_text_cache) > _TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+class Text(RebuildMixin, GameObject):
     """Text."""
 
     string = String("Text")
@@ -21,4 +59,7 @@ class Text(GameObject):
         return self.image.get_height()
 
     def _build(self) -> None:
-        self.image = self.font(self.size).render(self.string, True, self.color)
+        if not self._needs_rebuild((self.font, self.size, self.string, tuple(self.color))):
+            return
+
+        self.image = render_text(self.font, self.size, self.string, self.color)
@@ -1,18 +1,31 @@
 import pygame as pg
 
 from space_ranger.core import GameObject
-from space_ranger.core.property import Bool
+from space_ranger.core.property import Bool, Color
+from space_ranger.core.utils import RebuildMixin
 
 
-class UIElem(GameObject):
+_MOUSE_EVENTS = frozenset((pg.MOUSEMOTION, pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP))
+
+# shared by UI elements animations, adapted once at import time instead of on every animation setup
+HOVER_COLOR = Color.adapt(70)
+CLICK_COLOR = Color.adapt(50)
+
+
+class UIElem(RebuildMixin, GameObject):
     """UI element."""
 
     is_hovered = Bool()
     is_clicked = Bool()
 
+    _hover_rect: tuple[int, int, int, int] | None = None
+
     def process_event(self, event: pg.event.Event) -> None:
         """Process event..."""
-        self.is_hovered = self.rect.collidepoint(*pg.mouse.get_pos())
+        # hover state can only change on mouse events, which carry the mouse position
+        if event.type in _MOUSE_EVENTS:
+            self._hover_rect = tuple(self.rect)
+            self.is_hovered = self.rect.collidepoint(event.pos)
 
         if event.type == pg.MOUSEBUTTONDOWN and event.button == 1 and self.is_hovered:
             self.is_clicked = True
@@ -24,3 +37,14 @@ class UIElem(GameObject):
         #     self.set_transform(self.x + event.rel[0], self.y + event.rel[1])
 
         super().process_event(event)
+
+    def _update_hover(self) -> None:
+        """Update hover state after the element has moved.
+
+        Mouse events do not report an element sliding under a still cursor,
+        so the hit test is run again whenever the element rect changes.
+        """
+        rect = tuple(self.rect)
+        if rect != self._hover_rect:
+            self._hover_rect = rect
+            self.is_hovered = self.rect.collidepoint(pg.mouse.get_pos())
@@ -1,10 +1,14 @@
+import typing as t
 from enum import Enum, auto
+from functools import partial
 
 import pygame as pg
 
 from space_ranger import ctx
 from space_ranger.asset import FontAsset, SoundAsset
 from space_ranger.core import Scene, str
+from space_ranger.core.asset import FontFactory
+from space_ranger.core.utils import convert
 from space_ranger.ui import Button
 
 
@@ -19,6 +23,14 @@ class MenuState(Enum):
 class MainMenu(Scene):
     """A main menu state."""
 
+    _BACKGROUND_COLOR = pg.Color(230, 230, 230, 200)
+    _BUTTON_COLOR = pg.Color(100, 100, 100, 255)
+    _TEXT_COLOR = pg.Color(170, 170, 170, 255)
+    _PLAY_HOVER_COLOR = pg.Color(150, 250, 150, 255)
+    _CONTROLS_HOVER_COLOR = pg.Color(250, 250, 150, 255)
+    _OPTIONS_HOVER_COLOR = pg.Color(150, 250, 250, 255)
+    _EXIT_HOVER_COLOR = pg.Color(250, 150, 150, 255)
+
     def __init__(self, state_id: str) -> None:
         super().__init__(state_id)
 
@@ -26,7 +38,7 @@ class MainMenu(Scene):
         self.font_asset = FontAsset("MK-90.ttf")
 
         self.click_sound: pg.mixer.Sound
-        self.font: pg.font.Font
+        self.font: FontFactory
         self.button_color: pg.Color
         self.text_color: pg.Color
 
@@ -39,6 +51,14 @@ class MainMenu(Scene):
         self.button_controls: Button
         self.button_options: Button
         self.button_exit: Button
+        self._buttons: tuple[Button, ...]
+
+        self._hover_table: tuple[tuple[Button, pg.Color], ...]
+        self._hovered: list[bool]
+        self._click_handlers: dict[Button, t.Callable[[], None]]
+        self._last_mouse_pos: tuple[int, int] | None
+        self._button_dest_x: dict[MenuState, t.Callable[[Button], float]]
+        self._button_dests: tuple[tuple[float, float], ...]
 
         self.front_flash: pg.Surface
 
@@ -55,48 +75,79 @@ class MainMenu(Scene):
         super().start()
 
         self.click_sound = self.click_sound.load()
-        self.font = self.font_asset.load(int(ctx.settings.screen_height * 0.027))
-        self.button_color = pg.Color(100, 100, 100, 255)
-        self.text_color = pg.Color(170, 170, 170, 255)
+        # the loaded factory is memoized by the asset and keeps one font per size,
+        # buttons pick their own size from it
+        self.font = self.font_asset.load()
+        self.button_color = self._BUTTON_COLOR
+        self.text_color = self._TEXT_COLOR
 
-        self.button_play_hover_color = pg.Color(150, 250, 150, 255)
-        self.button_controls_hover_color = pg.Color(250, 250, 150, 255)
-        self.button_options_hover_color = pg.Color(150, 250, 250, 255)
-        self.button_exit_hover_color = pg.Color(250, 150, 150, 255)
+        self.button_play_hover_color = self._PLAY_HOVER_COLOR
+        self.button_controls_hover_color = self._CONTROLS_HOVER_COLOR
+        self.button_options_hover_color = self._OPTIONS_HOVER_COLOR
+        self.button_exit_hover_color = self._EXIT_HOVER_COLOR
 
         self.button_play = self._make_button("PLAY")
         self.button_controls = self._make_button("CONTROLS")
         self.button_options = self._make_button("OPTIONS")
         self.button_exit = self._make_button("EXIT")
+        self._buttons = (self.button_play, self.button_controls, self.button_options, self.button_exit)
 
-        self.front_flash = pg.Surface(ctx.settings.screen_size)
+        self._hover_table = (
+            (self.button_play, self.button_play_hover_color),
+            (self.button_controls, self.button_controls_hover_color),
+            (self.button_options, self.button_options_hover_color),
+            (self.button_exit, self.button_exit_hover_color),
+        )
+        self._hovered = [False] * len(self._hover_table)
+        self._click_handlers = {
+            self.button_controls: partial(self._toggle_state, MenuState.CONTROLS),
+            self.button_options: partial(self._toggle_state, MenuState.OPTIONS),
+            self.button_exit: self._exit,
+        }
+        self._last_mouse_pos = None
+
+        # the flash is plain white, only its surface alpha changes while animating
+        # display format surface with surface alpha takes the fastest alpha blit path
+        self.front_flash = convert(pg.Surface(ctx.settings.screen_size))
+        self.front_flash.fill((255, 255, 255))
 
         self.state = MenuState.MAIN
 
         self.updating = False
+        self._button_dests = ()
         self.update_time = 0
         self.update_time_max = 600
 
+        screen_width = ctx.settings.screen_width
+        screen_height = ctx.settings.screen_height
+        half_height = screen_height / 2
         button_height = self.button_play.height
-        self.space_between_buttons = int(ctx.settings.screen_height * 0.009)
+        self.space_between_buttons = space = int(screen_height * 0.009)
 
         self.button_play.position = pg.Vector2(  # type: ignore
-            (ctx.settings.screen_width - self.button_play.width) / 2,
-            ctx.settings.screen_height / 2 - button_height * 2 - self.space_between_buttons * 1.5,
+            (screen_width - self.button_play.width) / 2,
+            half_height - button_height * 2 - space * 1.5,
         )
         self.button_controls.position = (  # type: ignore
-            (ctx.settings.screen_width - self.button_controls.width) / 2,
-            ctx.settings.screen_height / 2 - button_height - self.space_between_buttons * 0.5,
+            (screen_width - self.button_controls.width) / 2,
+            half_height - button_height - space * 0.5,
         )
         self.button_options.position = (  # type: ignore
-            (ctx.settings.screen_width - self.button_options.width) / 2,
-            ctx.settings.screen_height / 2 + self.space_between_buttons * 0.5,
+            (screen_width - self.button_options.width) / 2,
+            half_height + space * 0.5,
         )
         self.button_exit.position = (  # type: ignore
-            (ctx.settings.screen_width - self.button_exit.width) / 2,
-            ctx.settings.screen_height / 2 + button_height + self.space_between_buttons * 1.5,
+            (screen_width - self.button_exit.width) / 2,
+            half_height + button_height + space * 1.5,
         )
 
+        # x destination of a button for every menu state
+        self._button_dest_x = {
+            MenuState.MAIN: lambda button: (screen_width - button.width) / 2,
+            MenuState.CONTROLS: lambda button: screen_width - space - button.width,
+            MenuState.OPTIONS: lambda button: space,
+        }
+
     def finish(self) -> None:
         """Cleanup."""
         super().finish()
@@ -107,10 +158,12 @@ class MainMenu(Scene):
         :param pg.event.Event event: A pygame event to process.
         """
         if event.type == pg.MOUSEBUTTONDOWN:
-            self._handle_click()
+            self._handle_click(event.pos)
 
         if event.type == pg.KEYDOWN and event.key == pg.K_u:
             self.button_play.position = (100, 100)  # type: ignore
+            # button moved under the mouse, hover has to be checked again
+            self._last_mouse_pos = None
 
         if event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE:
             self._quit = True
@@ -122,36 +175,37 @@ class MainMenu(Scene):
         :param int delta_time: Delta time (in milliseconds).
         """
         self.update_time += delta_time
-        self._update_buttons_colors()
 
         if self.update_progress >= 1:
             self.updating = False
 
         if self.updating:
-            self.logger.debug(f"Updating... t={self.update_time} ({self.update_progress})")
-            self._move_button(self.button_play)
-            self._move_button(self.button_controls)
-            self._move_button(self.button_options)
-            self._move_button(self.button_exit)
+            self.logger.debug("Updating... t=%s (%s)", self.update_time, self.update_progress)
+            for button, dest in zip(self._buttons, self._button_dests):
+                self._move_button(button, dest)
+
+        # hover can only change if the mouse or the buttons have moved
+        mouse_pos = pg.mouse.get_pos()
+        if self.updating or mouse_pos != self._last_mouse_pos:
+            self._last_mouse_pos = mouse_pos
+            self._update_buttons_colors(mouse_pos)
 
     def draw(self, screen: pg.Surface) -> None:
         """Draw main menu on a given screen.
 
         :param pg.Surface screen: Target screen.
         """
-        screen.fill(pg.Color(230, 230, 230, 200))
+        screen.fill(self._BACKGROUND_COLOR)
 
-        self.button_play.draw(screen)
-        self.button_controls.draw(screen)
-        self.button_options.draw(screen)
-        self.button_exit.draw(screen)
+        for button in self._buttons:
+            button.draw(screen)
 
         if self.updating:
             t = self.update_progress
-            alpha = max(0, int((-7 * t * t + 4 * t) * 255))
-            self.front_flash.set_alpha(alpha)
-            self.front_flash.fill(pg.Color(255, 255, 255, alpha))
-            screen.blit(self.front_flash, (0, 0))
+            alpha = int((-7 * t * t + 4 * t) * 255)
+            if alpha > 0:
+                self.front_flash.set_alpha(alpha)
+                screen.blit(self.front_flash, (0, 0))
 
     @property
     def update_progress(self) -> float:
@@ -173,96 +227,75 @@ class MainMenu(Scene):
             text_font=self.font,
         )
 
-    def _handle_click(self) -> None:
-        """Handle mouse button click."""
+    def _handle_click(self, mouse_point: tuple[int, int]) -> None:
+        """Handle mouse button click.
+
+        :param tuple[int, int] mouse_point: Mouse position at the moment of click.
+        """
         self.click_sound.play()
-        clicked_button = self._get_hovered_button()
+        clicked_button = self._get_hovered_button(mouse_point)
 
         if not clicked_button:
             return
 
-        self.logger.info(f"Clicked: {clicked_button.text}")
-
-        if clicked_button == self.button_play:
-            pass
-
-        if clicked_button == self.button_controls:
-            if self.state == MenuState.CONTROLS:
-                self.state = MenuState.MAIN
-            else:
-                self.state = MenuState.CONTROLS
+        self.logger.info("Clicked: %s", clicked_button.text)
 
-            self.update_time = 0
-            self.updating = True
+        handler = self._click_handlers.get(clicked_button)
+        if handler is not None:
+            handler()
 
-        if clicked_button == self.button_options:
-            if self.state == MenuState.OPTIONS:
-                self.state = MenuState.MAIN
-            else:
-                self.state = MenuState.OPTIONS
+    def _toggle_state(self, state: MenuState) -> None:
+        """Switch between main menu and a given state, and start buttons animation.
 
-            self.update_time = 0
-            self.updating = True
-
-        if clicked_button == self.button_exit:
-            self._quit = True
-            return
-
-    def _update_buttons_colors(self) -> None:
-        """Highlight hovered button."""
-        mouse_point = pg.mouse.get_pos()
-
-        if self.button_play._rect.collidepoint(mouse_point):
-            self.button_play.text_color = self.button_play_hover_color
-        else:
-            self.button_play.text_color = self.text_color
-
-        if self.button_controls._rect.collidepoint(mouse_point):
-            self.button_controls.text_color = self.button_controls_hover_color
-        else:
-            self.button_controls.text_color = self.text_color
-
-        if self.button_options._rect.collidepoint(mouse_point):
-            self.button_options.text_color = self.button_options_hover_color
-        else:
-            self.button_options.text_color = self.text_color
-
-        if self.button_exit._rect.collidepoint(mouse_point):
-            self.button_exit.text_color = self.button_exit_hover_color
-        else:
-            self.button_exit.text_color = self.text_color
-
-    def _move_button(self, button: Button) -> None:
-        current_pos = pg.math.Vector2(button.position.x, button.position.y)
-        dest_pos = self._get_button_dest(button)
-        path_vector = current_pos + (dest_pos - current_pos) * self.update_progress
-        button.position = path_vector
+        :param MenuState state: A state to toggle.
+        """
+        self.state = MenuState.MAIN if self.state == state else state
+        # destinations do not change while buttons are moving
+        self._button_dests = tuple(self._get_button_dest(button) for button in self._buttons)
+        self.update_time = 0
+        self.updating = True
 
-    def _get_button_dest(self, button: Button) -> pg.math.Vector2:
-        if self.state == MenuState.MAIN:
-            x = (ctx.settings.screen_width - button.width) / 2
+    def _exit(self) -> None:
+        """Quit main menu."""
+        self._quit = True
 
-        if self.state == MenuState.CONTROLS:
-            x = ctx.settings.screen_width - self.space_between_buttons - button.width
+    def _update_buttons_colors(self, mouse_point: tuple[int, int]) -> None:
+        """Highlight hovered button.
 
-        if self.state == MenuState.OPTIONS:
-            x = self.space_between_buttons
+        :param tuple[int, int] mouse_point: Current mouse position.
+        """
+        # text color is only set when hover state changes, setting it rebuilds the button
+        # buttons do not overlap, so a single scan finds the only hovered one
+        hovered_button = self._get_hovered_button(mouse_point)
+        hovered_flags = self._hovered
+        for i, (button, hover_color) in enumerate(self._hover_table):
+            hovered = button is hovered_button
+            if hovered != hovered_flags[i]:
+                hovered_flags[i] = hovered
+                button.text_color = hover_color if hovered else self.text_color
+
+    def _move_button(self, button: Button, dest: tuple[float, float]) -> None:
+        progress = self.update_progress
+        current_x, current_y = button.position
+        dest_x, dest_y = dest
+        # keep buttons on the pixel grid, so they are not blitted at fractional positions
+        button.position = (  # type: ignore
+            round(current_x + (dest_x - current_x) * progress),
+            round(current_y + (dest_y - current_y) * progress),
+        )
 
-        return pg.math.Vector2(x, button.position.y)
+    def _get_button_dest(self, button: Button) -> tuple[float, float]:
+        return self._button_dest_x[self.state](button), button.position.y
 
-    def _get_hovered_button(self) -> Button | None:
+    def _get_hovered_button(self, mouse_point: tuple[int, int]) -> Button | None:
         """Get a button on which mouse is hovered on.
 
+        :param tuple[int, int] mouse_point: Mouse position to check buttons against.
+
         :return: A currently hovered button if available, None otherwise.
         :rtype: Button | None
         """
-        mouse_point = pg.mouse.get_pos()
-        for button in (
-            self.button_play,
-            self.button_controls,
-            self.button_options,
-            self.button_exit,
-        ):
+        for button in self._buttons:
             if button._rect.collidepoint(mouse_point):
                 return button
         return None
@@ -1,18 +1,92 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import atan2, pi
+from math import atan2, cos, hypot, pi, radians, sin
 
 import pygame as pg
 
 from space_ranger.core import Scene, ctx
 from space_ranger.core.asset.image_asset import ImageAsset
-from space_ranger.core.utils import draw_arrow, get_text_surface
+from space_ranger.core.utils import Alignment, convert, draw_arrow, get_text_surface
+
+
+_RAD2DEG = 180 / pi
+
+# debug free look camera controls: key -> movement direction
+_CAMERA_MOVE_KEYS = (
+    (pg.K_p, (0, -1)),
+    (pg.K_SEMICOLON, (0, 1)),
+    (pg.K_l, (-1, 0)),
+    (pg.K_QUOTE, (1, 0)),
+)
+
+
+def _format_vector(vector: pg.math.Vector2, precision: int) -> str:
+    """Format a vector for a debug label.
+
+    Values are rounded, so that labels do not change (and are not
+    rendered again) because of tiny changes of the values.
+
+    :param pg.math.Vector2 vector: A vector to format.
+    :param int precision: Number of digits after the decimal point.
+
+    :return str: Formatted vector.
+    """
+    x, y = vector
+    return f"[{x:.{precision}f}, {y:.{precision}f}]"
+
+
+class _DebugText:
+    """A debug label which is rendered again only when its text changes."""
+
+    __slots__ = ("_alignment", "_lines", "_surface")
+
+    def __init__(self, alignment: Alignment = "left") -> None:
+        self._alignment = alignment
+        self._lines: tuple[str, ...] = ()
+        self._surface: pg.Surface | None = None
+
+    def render(self, *lines: str) -> pg.Surface:
+        """Get a debug text surface for given lines.
+
+        :return: A surface with given text lines.
+        :rtype: pg.Surface
+        """
+        if self._surface is None or lines != self._lines:
+            self._surface = get_text_surface(
+                *lines,
+                font=ctx.debug_text_font,
+                color=ctx.debug_text_color,
+                background=ctx.debug_text_background,
+                antialias=True,
+                alignment=self._alignment,
+            )
+            self._lines = lines
+        return self._surface
 
 
 class Camera:
     """A scene camera."""
 
+    __slots__ = (
+        "_sprites",
+        "_background_color",
+        "_min_zoom",
+        "_max_zoom",
+        "_zoom_scale",
+        "_offset",
+        "_position",
+        "_screen",
+        "_screen_center",
+        "_vscreen_size",
+        "_vscreen_surface",
+        "_vscreen_center",
+        "_vscreen_rect",
+        "_offset_base",
+        "_scaled_rect",
+        "_scaled_surface",
+    )
+
     def __init__(
         self,
         background_color: pg.Color,
@@ -27,10 +101,11 @@ class Camera:
         self._max_zoom = round(float(max_zoom), 3)
         self._zoom_scale: float = 1
 
-        self._offset: pg.math.Vector2 = pg.math.Vector2()
+        self._offset: tuple[float, float] = (0.0, 0.0)
         self._position: pg.math.Vector2 = pg.math.Vector2()
 
         self._screen = screen
+        self._screen_center = screen.get_rect().center
         self._vscreen_size = pg.Vector2(self._screen.get_rect().size) / self._min_zoom
         self._vscreen_surface = pg.Surface(self._vscreen_size, pg.SRCALPHA)
         self._vscreen_center = pg.math.Vector2(
@@ -39,6 +114,17 @@ class Camera:
         )
         self._vscreen_rect = self._vscreen_surface.get_rect(center=self._vscreen_center)
 
+        # virtual screen never changes its size, so everything but the position
+        # in the offset is constant: center + (size // 2 - center)
+        self._offset_base = (
+            self._vscreen_size.x // 2,
+            self._vscreen_size.y // 2,
+        )
+
+        # reused every frame to place the (scaled) virtual screen
+        self._scaled_rect = pg.Rect(0, 0, 0, 0)
+        self._scaled_surface: pg.Surface | None = None
+
         self._calculate_offset()
 
     def add(self, sprite: pg.sprite.Sprite) -> None:
@@ -73,25 +159,46 @@ class Camera:
     def draw(self) -> None:
         """Draw sprites."""
         self._vscreen_surface.fill(self._background_color)
+        offset_x, offset_y = self._offset
+        vscreen_rect = self._vscreen_rect
+        blit_sequence = []
         for sprite in self._sprites:
-            sprite.rect.center = sprite.position + self._offset
-            self._vscreen_surface.blit(sprite.image, sprite.rect.topleft)
-            if ctx.config.debug:
+            x, y = sprite.position
+            sprite.rect.center = (x + offset_x, y + offset_y)
+            # sprites outside of the virtual screen are not drawn at all
+            if vscreen_rect.colliderect(sprite.rect):
+                blit_sequence.append((sprite.image, sprite.rect))
+        self._vscreen_surface.blits(blit_sequence, doreturn=False)
+        debug = ctx.config.debug
+        if debug:
+            for sprite in self._sprites:
                 sprite._draw_debug(self._vscreen_surface)
-            # sprite.draw(self._vscreen_surface)
 
-        scaled_surface = pg.transform.scale(self._vscreen_surface, self._vscreen_size * self.zoom)
-        scaled_rect = scaled_surface.get_rect(center=self._screen.get_rect().center)
+        zoom = self.zoom
+        if abs(zoom - 1) < 1e-3:
+            # virtual screen is already at its final size
+            scaled_surface = self._vscreen_surface
+        else:
+            # scale into the same surface while the zoomed size stays the same
+            size = (int(self._vscreen_size.x * zoom), int(self._vscreen_size.y * zoom))
+            scaled_surface = self._scaled_surface
+            if scaled_surface is None or scaled_surface.get_size() != size:
+                scaled_surface = self._scaled_surface = pg.Surface(size, pg.SRCALPHA)
+            pg.transform.scale(self._vscreen_surface, size, scaled_surface)
+        scaled_rect = self._scaled_rect
+        scaled_rect.size = scaled_surface.get_size()
+        scaled_rect.center = self._screen_center
         self._screen.blit(scaled_surface, scaled_rect)
-        if ctx.config.debug:
+        if debug:
             pg.draw.rect(self._screen, (255, 255, 0), scaled_rect, 1)
 
     def _clamp_zoom(self, zoom_value: float) -> float:
         return pg.math.clamp(zoom_value, self._min_zoom, self._max_zoom)
 
     def _calculate_offset(self) -> None:
-        zoom_offset = pg.math.Vector2(self._vscreen_size // 2 - self._vscreen_center)
-        self._offset = -self._position + self._vscreen_center + zoom_offset
+        x, y = self._position
+        base_x, base_y = self._offset_base
+        self._offset = (base_x - x, base_y - y)
 
 
 class Sprite(pg.sprite.Sprite):
@@ -100,23 +207,50 @@ class Sprite(pg.sprite.Sprite):
     position: pg.math.Vector2
     rotation: float
 
+    _source_image: pg.Surface
+    _rotated_images: dict[int, pg.Surface]
+    _image_angle: int | None
+    _debug_text: _DebugText
+
     def __new__(cls, *args, **kwargs) -> None:  # noqa: D102
         obj = super().__new__(cls)
         obj.position = pg.math.Vector2()
         obj.rotation = 0.0
         obj.image = None
         obj.rect = None
+        obj._rotated_images = {}
+        obj._image_angle = None
+        obj._debug_text = _DebugText()
         return obj
 
     def __init__(self) -> None:
         super().__init__()
-        self.image = self._get_image()
+        # the source image is built once, all rotations are made from it
+        self._source_image = self._get_image()
+        self.image = self._source_image
         self._update_image()
 
     def _update_image(self) -> None:
-        """Build a thing."""
-        self.image = pg.transform.rotate(self._get_image(), -self.rotation)
-        self.rect = self.image.get_rect()
+        """Build a thing.
+
+        Rotation is quantized to whole degrees and rotated images are cached,
+        so the image is rotated at most once per angle.
+        """
+        angle = round(self.rotation) % 360
+        if angle != self._image_angle:
+            if angle == 0:
+                image = self._source_image
+            else:
+                image = self._rotated_images.get(angle)
+                if image is None:
+                    image = pg.transform.rotate(self._source_image, -angle)
+                    self._rotated_images[angle] = image
+            self.image = image
+            if self.rect is None:
+                self.rect = image.get_rect()
+            else:
+                self.rect.size = image.get_size()
+            self._image_angle = angle
         self.rect.center = self.position
 
     def _get_image(self) -> pg.Surface:
@@ -124,20 +258,15 @@ class Sprite(pg.sprite.Sprite):
 
     def _draw_debug(self, surface: pg.Surface) -> None:
         pg.draw.rect(surface, "red", self.rect, width=1)
-        debug_surface = get_text_surface(
-            f"pos: {self.position}",
-            f"rot: {round(self.rotation, 2)}",
-            font=ctx.debug_text_font,
-            color=ctx.debug_text_color,
-            background=ctx.debug_text_background,
-            antialias=True,
+        debug_surface = self._debug_text.render(
+            f"pos: {_format_vector(self.position, 1)}",
+            f"rot: {self.rotation:.1f}",
         )
-        pos = pg.math.Vector2(self.rect.topleft)
-        pos.y -= debug_surface.get_height()
-        surface.blit(debug_surface, (pos))
+        left, top = self.rect.topleft
+        surface.blit(debug_surface, (left, top - debug_surface.get_height()))
 
 
-@dataclass
+@dataclass(slots=True)
 class SpaceshipCore:
     """Spaceship core."""
 
@@ -160,6 +289,9 @@ class Spaceship(Sprite):
         self.velocity = pg.math.Vector2(0, 0)
         self.acceleration = pg.math.Vector2(0, 0)
 
+        self._last_mouse_pos: tuple[int, int] | None = None
+        self._screen_center = tuple(ctx.screen.center)
+
         self.engine = SpaceshipCore(50, 10, 10)
         self.mass = 200
         self.density = 10
@@ -175,45 +307,65 @@ class Spaceship(Sprite):
         """Get maximum spaceship speed."""
         return self.engine.max_speed
 
-    def update(self, delta_time: int) -> None:
-        """Update player."""
-        self._update_engine()
-        self._update_rotation()
+    def update(self, delta_time: int, keys: pg.key.ScancodeWrapper, mouse_pos: tuple[int, int]) -> None:
+        """Update player.
+
+        :param int delta_time: Delta time (in milliseconds).
+        :param pg.key.ScancodeWrapper keys: Pressed keys state for the current frame.
+        :param tuple[int, int] mouse_pos: Mouse position for the current frame.
+        """
+        self._update_engine(keys)
+        self._update_rotation(mouse_pos)
         self._move()
         self._update_image()
 
     def _get_image(self) -> None:
         return self._original_image
 
-    def _update_engine(self) -> None:
-        keys = pg.key.get_pressed()
-        self.engine.back_engine_power = float(keys[ctx.controls.move_forward])
-        self.engine.front_engine_power = float(keys[ctx.controls.move_backward])
-        self.engine.left_engine_power = float(keys[ctx.controls.move_right])
-        self.engine.right_engine_power = float(keys[ctx.controls.move_left])
-
-    def _update_rotation(self) -> None:
-        mouse = pg.math.Vector2(pg.mouse.get_pos())
-        dx = mouse.x - ctx.screen.center.x
-        dy = mouse.y - ctx.screen.center.y
-        angle = atan2(dy, dx) * 180 / pi
-        self.rotation = angle
+    def _update_engine(self, keys: pg.key.ScancodeWrapper) -> None:
+        controls = ctx.controls
+        engine = self.engine
+        engine.back_engine_power = float(keys[controls.move_forward])
+        engine.front_engine_power = float(keys[controls.move_backward])
+        engine.left_engine_power = float(keys[controls.move_right])
+        engine.right_engine_power = float(keys[controls.move_left])
+
+    def _update_rotation(self, mouse_pos: tuple[int, int]) -> None:
+        # the ship faces the mouse relative to the screen center,
+        # so the rotation only changes when the mouse moves
+        if mouse_pos == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = mouse_pos
+        mouse_x, mouse_y = mouse_pos
+        center_x, center_y = self._screen_center
+        self.rotation = atan2(mouse_y - center_y, mouse_x - center_x) * _RAD2DEG
 
     def _move(self) -> None:
         self.acceleration = self._calculate_acceleration()
         self.velocity += self.acceleration
-        if self.velocity:
-            self.velocity.clamp_magnitude_ip(self.engine.max_speed)
+        # compare squared lengths, the common below-max-speed case needs no sqrt
+        max_speed = self.engine.max_speed
+        if self.velocity.magnitude_squared() > max_speed * max_speed:
+            self.velocity.scale_to_length(max_speed)
         self.position += self.velocity
 
     def _calculate_acceleration(self) -> pg.math.Vector2:
-        acceleration = sum(self._get_forces(), start=pg.math.Vector2())
-        if not acceleration:
+        # sum engine forces in ship space and rotate the result once,
+        # instead of rotating each force separately (see _get_forces)
+        engine = self.engine
+        force_x = (engine.back_engine_power - engine.front_engine_power * 0.6) * engine.power
+        force_y = (engine.left_engine_power - engine.right_engine_power) * 0.4 * engine.power
+        if force_x or force_y:
+            angle = radians(self.rotation)
+            cos_a = cos(angle)
+            sin_a = sin(angle)
+            acceleration = pg.math.Vector2(cos_a * force_x - sin_a * force_y, sin_a * force_x + cos_a * force_y)
+        else:
             if not self.velocity:
-                return acceleration
-            acceleration = -self.velocity * self.engine.power * 0.3
+                return pg.math.Vector2()
+            acceleration = -self.velocity * engine.power * 0.3
         acceleration /= self.mass
-        if acceleration.magnitude() <= 0.002:
+        if acceleration.magnitude_squared() <= 0.002 * 0.002:
             return pg.math.Vector2()
         return acceleration
 
@@ -231,20 +383,15 @@ class Spaceship(Sprite):
             draw_arrow(surface, self.rect.center, force, "green")
         draw_arrow(surface, self.rect.center, self.velocity * 20, "yellow")
         draw_arrow(surface, self.rect.center, self.acceleration * 20, "red")
-        debug_surface = get_text_surface(
-            f"pos: {self.position}",
-            f"rot: {round(self.rotation, 2)}",
-            f"vel: {self.velocity}",
-            f"acc: {self.acceleration}",
-            f"spd: {self.speed}",
-            font=ctx.debug_text_font,
-            color=ctx.debug_text_color,
-            background=ctx.debug_text_background,
-            antialias=True,
+        debug_surface = self._debug_text.render(
+            f"pos: {_format_vector(self.position, 1)}",
+            f"rot: {self.rotation:.1f}",
+            f"vel: {_format_vector(self.velocity, 2)}",
+            f"acc: {_format_vector(self.acceleration, 3)}",
+            f"spd: {self.speed:.2f}",
         )
-        pos = pg.math.Vector2(self.rect.topleft)
-        pos.y -= debug_surface.get_height()
-        surface.blit(debug_surface, (pos))
+        left, top = self.rect.topleft
+        surface.blit(debug_surface, (left, top - debug_surface.get_height()))
 
 
 class RectSprite(Sprite):
@@ -256,8 +403,11 @@ class RectSprite(Sprite):
         super().__init__()
 
     def _get_image(self) -> pg.Surface:
-        image = pg.Surface((self.width, self.height), pg.SRCALPHA)
-        image.fill(pg.Color(234, 255, 34, 127))
+        # uniformly translucent, so surface alpha is enough: it is blitted
+        # much faster than per-pixel alpha and is in the display format
+        image = convert(pg.Surface((self.width, self.height)))
+        image.fill(pg.Color(234, 255, 34))
+        image.set_alpha(127)
         return image
 
 
@@ -280,6 +430,10 @@ class Playground(Scene):
         self.entities.append(self.rect)
         self.rect.position = (300, 300)
 
+        self._debug_text = _DebugText("right")
+        # screen size is fixed for the scene lifetime
+        self._screen_center = tuple(ctx.screen.center)
+
     def _process_event(self, event: pg.event.Event) -> None:
         if event.type == pg.QUIT:
             self.exit_application()
@@ -289,33 +443,33 @@ class Playground(Scene):
             self.camera_free_look = not self.camera_free_look
 
     def _update(self, delta_time: int) -> None:
-        self.player.update(delta_time)
-
+        # input is read once per frame and shared with the player
         key = pg.key.get_pressed()
+        mouse_pos = pg.mouse.get_pos()
+        self.player.update(delta_time, key, mouse_pos)
 
         # debug camera controller
         if self.camera_free_look and ctx.config.debug:
             cam_speed = 7
             zoom_speed = 0.01
-            if key[pg.K_p]:
-                self.camera.center_at(self.camera._position + (0, -cam_speed))
-            if key[pg.K_SEMICOLON]:
-                self.camera.center_at(self.camera._position + (0, cam_speed))
-            if key[pg.K_l]:
-                self.camera.center_at(self.camera._position + (-cam_speed, 0))
-            if key[pg.K_QUOTE]:
-                self.camera.center_at(self.camera._position + (cam_speed, 0))
+            for move_key, (dx, dy) in _CAMERA_MOVE_KEYS:
+                if key[move_key]:
+                    self.camera.center_at(self.camera._position + (dx * cam_speed, dy * cam_speed))
             if key[pg.K_o]:
                 self.camera.zoom -= zoom_speed
             if key[pg.K_LEFTBRACKET]:
                 self.camera.zoom += zoom_speed
         else:
-            offset = pg.math.Vector2(pg.mouse.get_pos())
-            offset -= ctx.screen.center
-            if offset:
-                offset.normalize_ip()
-            offset *= offset.magnitude() * 20
-            self.camera.center_at(self.player.position + offset)
+            # look 20 pixels ahead towards the mouse
+            mouse_x, mouse_y = mouse_pos
+            center_x, center_y = self._screen_center
+            dx = mouse_x - center_x
+            dy = mouse_y - center_y
+            distance = hypot(dx, dy)
+            if distance:
+                dx *= 20 / distance
+                dy *= 20 / distance
+            self.camera.center_at(self.player.position + (dx, dy))
             self.camera.zoom = 1 + (1 - self.camera._min_zoom) * (self.player.speed / self.player.max_speed)
             # if self.player.acceleration:
             #     self.camera.zoom -= 0.01
@@ -344,12 +498,5 @@ class Playground(Scene):
         lines.append(
             f"    zoom [{self.camera._min_zoom}, {self.camera._max_zoom}]: {round(self.camera._zoom_scale, 3)}"
         )
-        debug_surface = get_text_surface(
-            *lines,
-            font=ctx.debug_text_font,
-            color=ctx.debug_text_color,
-            background=ctx.debug_text_background,
-            antialias=True,
-            alignment="right",
-        )
+        debug_surface = self._debug_text.render(*lines)
         surface.blit(debug_surface, (ctx.screen.width - debug_surface.get_width(), 0))
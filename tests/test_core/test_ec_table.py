@@ -124,6 +124,68 @@ def test_delete_entity_raises_error_for_invalid_uid(ec_table: EcTable) -> None:
     assert uid in ec_table._table
 
 
+def test_archetype_follows_entity_components(ec_table: EcTable) -> None:
+    """Test that an entity archetype is updated when its components change."""
+    entity = ec_table.create_entity("entity", ComponentA())
+    uid = entity.uid
+
+    assert ec_table.get_archetype(uid) == {EntityData, ComponentA}
+
+    ec_table.add_component(uid, ComponentB())
+    assert ec_table.get_archetype(uid) == {EntityData, ComponentA, ComponentB}
+
+    ec_table.remove_component(uid, ComponentA)
+    assert ec_table.get_archetype(uid) == {EntityData, ComponentB}
+
+    ec_table.delete_entity(uid)
+    with pytest.raises(UnknownEntityUidError):
+        ec_table.get_archetype(uid)
+    assert all(uid not in uids for uids in ec_table._archetypes.values())
+
+
+def test_iter_uids_by_components(ec_table: EcTable) -> None:
+    """Test that `iter_uids_by_components()` yields entities having all given components."""
+    entity_a = ec_table.create_entity("a", ComponentA())
+    entity_b = ec_table.create_entity("b", ComponentB())
+    entity_ab = ec_table.create_entity("ab", ComponentA(), ComponentB())
+
+    assert set(ec_table.iter_uids_by_components(ComponentA)) == {entity_a.uid, entity_ab.uid}
+    assert set(ec_table.iter_uids_by_components(ComponentA, ComponentB)) == {entity_ab.uid}
+    assert set(ec_table.iter_uids_by_components()) == {entity_a.uid, entity_b.uid, entity_ab.uid}
+
+
+def test_iter_entities(ec_table: EcTable) -> None:
+    """Test that `iter_entities()` yields every entity in the table."""
+    entity_a = ec_table.create_entity("a", ComponentA())
+    entity_b = ec_table.create_entity("b")
+
+    assert {entity.uid for entity in ec_table.iter_entities()} == {entity_a.uid, entity_b.uid}
+
+
+def test_iter_entities_empty_table(ec_table: EcTable) -> None:
+    """Test that `iter_entities()` yields nothing for an empty table."""
+    assert list(ec_table.iter_entities()) == []
+
+
+def test_iter_components(ec_table: EcTable) -> None:
+    """Test that `iter_components()` yields all entity components including :class:`EntityData`."""
+    component_a = ComponentA()
+    component_b = ComponentB()
+    entity = ec_table.create_entity("entity", component_a, component_b)
+
+    components = list(ec_table.iter_components(entity.uid))
+
+    assert len(components) == 3
+    assert component_a in components
+    assert component_b in components
+    assert any(isinstance(component, EntityData) for component in components)
+
+
+def test_iter_components_raises_error_for_invalid_uid(ec_table: EcTable) -> None:
+    """Test that `iter_components()` raises :class:`UnknownEntityUidError` for an unknown UID."""
+    with pytest.raises(UnknownEntityUidError):
+        ec_table.iter_components(generate_entity_uid())
+
+
 # TODO: write tests for components mantipulation methods in EcTable
-# TODO: write tests for entities and components iterators in EcTable
 # TODO: write tests for entities querying methods in EcTable
@@ -0,0 +1,36 @@
+import pygame as pg
+import pytest
+
+from space_ranger.core.asset import FontFactory
+
+
+class FakeFont:  # noqa: D101
+    def __init__(self, path: str | None, size: int) -> None:
+        self.path = path
+        self.size = size
+
+
+@pytest.fixture
+def font_factory(monkeypatch: pytest.MonkeyPatch) -> FontFactory:
+    """Create a font factory which does not load real font files.
+
+    :return: FontFactory instance
+    :rtype: FontFactory
+    """
+    monkeypatch.setattr(pg.font, "Font", FakeFont)
+    return FontFactory(None)
+
+
+def test_font_factory_same_size_returns_same_font(font_factory: FontFactory) -> None:
+    """Test that a font is loaded once per size and reused afterwards."""
+    assert font_factory(20) is font_factory(20)
+
+
+def test_font_factory_different_size_returns_different_font(font_factory: FontFactory) -> None:
+    """Test that different sizes get different fonts."""
+    font_20 = font_factory(20)
+    font_30 = font_factory(30)
+
+    assert font_20 is not font_30
+    assert font_20.size == 20
+    assert font_30.size == 30
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+
+from space_ranger.core import Component
+from space_ranger.core.ec_table import EcTable
+from space_ranger.core.entity import generate_entity_uid
+from space_ranger.core.system import System
+
+
+@dataclass(slots=True)
+class ComponentA(Component):  # noqa: D101
+    a: int = 0
+
+
+@dataclass(slots=True)
+class ComponentB(Component):  # noqa: D101
+    b: int = 0
+
+
+def executor(app, entities) -> None:  # noqa: D103
+    pass
+
+
+def test_match_entity_with_all_required_components(ec_table: EcTable) -> None:
+    """Test that an entity with all required (and some extra) components matches a system."""
+    system = System("system", executor, ec_table, ComponentA)
+    entity = ec_table.create_entity("player", ComponentA(), ComponentB())
+
+    assert system.match_entity(entity.uid)
+
+
+def test_match_entity_without_required_component(ec_table: EcTable) -> None:
+    """Test that an entity lacking a required component does not match a system."""
+    system = System("system", executor, ec_table, ComponentA, ComponentB)
+    entity = ec_table.create_entity("player", ComponentA())
+
+    assert not system.match_entity(entity.uid)
+
+
+def test_match_entity_unknown_uid(ec_table: EcTable) -> None:
+    """Test that an unknown entity does not match a system with required components."""
+    system = System("system", executor, ec_table, ComponentA)
+
+    assert not system.match_entity(generate_entity_uid())
+
+
+def test_match_entity_unknown_uid_no_required_components(ec_table: EcTable) -> None:
+    """Test that any entity, even an unknown one, matches a system without required components."""
+    system = System("system", executor, ec_table)
+
+    assert system.match_entity(generate_entity_uid())
@@ -0,0 +1,60 @@
+import pygame as pg
+
+from space_ranger.core.utils import RebuildMixin, circle, rect, square
+
+
+RED = pg.Color(255, 0, 0)
+
+
+def test_rect_is_filled_with_color() -> None:
+    """Test that `rect()` returns a surface of the given size filled with the given color."""
+    surface = rect(4, 3, RED)
+
+    assert surface.get_size() == (4, 3)
+    assert surface.get_at((0, 0)) == RED
+    assert surface.get_at((3, 2)) == RED
+
+
+def test_square_is_filled_with_color() -> None:
+    """Test that `square()` returns a square surface filled with the given color."""
+    surface = square(4, RED)
+
+    assert surface.get_size() == (4, 4)
+    assert surface.get_at((2, 2)) == RED
+
+
+def test_circle_is_drawn_with_color() -> None:
+    """Test that `circle()` draws a circle of the given radius and color."""
+    surface = circle(5, RED)
+
+    assert surface.get_size() == (10, 10)
+    assert surface.get_at((5, 5)) == RED
+
+
+def test_circle_background_is_transparent() -> None:
+    """Test that `circle()` leaves the area outside of the circle transparent without clearing it."""
+    surface = circle(5, RED)
+
+    assert surface.get_at((0, 0)).a == 0
+    assert surface.get_at((9, 9)).a == 0
+
+
+def test_needs_rebuild_first_build() -> None:
+    """Test that an object is always built for the first time."""
+    assert RebuildMixin()._needs_rebuild((1, 2))
+
+
+def test_needs_rebuild_same_key() -> None:
+    """Test that an object is not rebuilt while its build key stays the same."""
+    obj = RebuildMixin()
+    obj._needs_rebuild((1, 2))
+
+    assert not obj._needs_rebuild((1, 2))
+
+
+def test_needs_rebuild_changed_key() -> None:
+    """Test that an object is rebuilt when its build key changes."""
+    obj = RebuildMixin()
+    obj._needs_rebuild((1, 2))
+
+    assert obj._needs_rebuild((1, 3))